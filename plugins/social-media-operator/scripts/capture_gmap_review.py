@@ -9,10 +9,11 @@ Configuration via environment variables:
     GOOGLE_MAPS_URL    - Google Maps URL for your business (short or full)
     PLACE_NAME         - Business name (used for search fallback)
     PLACE_SEARCH_QUERY - Optional: full search query (defaults to PLACE_NAME)
+    GMAP_DEBUG         - Optional: set to save debug screenshots on every run
 
 Strategy:
-1. Launch Playwright with anti-detection flags
-2. Login to Google account
+1. Launch Playwright with anti-detection flags (persistent profile)
+2. Login to Google account (skipped when the profile is already signed in)
 3. Navigate to the business place page
 4. Click Reviews tab (visible when logged in)
 5. Find a 5-star review with substantial text
@@ -21,6 +22,7 @@ Strategy:
 """
 
 import asyncio
+import html
 import json
 import os
 import sys
@@ -30,6 +32,11 @@ from pathlib import Path
 
 from playwright.async_api import async_playwright
 
+try:
+    import orjson  # optional: faster posts.json parse/dump
+except ImportError:
+    orjson = None
+
 # Allow sibling scripts in the same directory to be imported directly
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
@@ -39,10 +46,19 @@ GOOGLE_PASSWORD = os.environ.get("GOOGLE_PASSWORD", "")
 PLACE_NAME = os.environ.get("PLACE_NAME", "Your Business")
 GOOGLE_MAPS_URL = os.environ.get("GOOGLE_MAPS_URL", "")
 PLACE_SEARCH_QUERY = os.environ.get("PLACE_SEARCH_QUERY", PLACE_NAME)
+DEBUG = bool(os.environ.get("GMAP_DEBUG"))
 
 # Paths relative to working directory (run from workspace root)
 SCREENSHOTS_DIR = Path.cwd() / "screenshots"
 DATA_FILE = Path.cwd() / "data" / "posts.json"
+# Persistent Chromium profile: keeps Google auth cookies between runs
+PROFILE_DIR = Path.cwd() / ".cache" / "chromium-profile"
+# Launch errors Chromium gives when another process holds the profile lock
+_PROFILE_LOCKED_ERRORS = (
+    "ProcessSingleton",
+    "SingletonLock",
+    "profile appears to be in use",
+)
 
 # Review selectors (2025 verified)
 SEL_REVIEW_CARD = "div.jftiEf"
@@ -52,6 +68,11 @@ SEL_REVIEWER_NAME = ".d4r55"
 SEL_REVIEW_DATE = ".rsqaWe"
 SEL_SCROLLABLE = ".DxyBCb"
 
+# Star count from a rating aria-label (e.g. "5 stars")
+_STAR_RE = re.compile(r"(\d+)")
+# Quoted review text at the start of a google-maps post's generatedContent
+_QUOTED_RE = re.compile(r'^"([^"]*)"')
+
 
 def validate_config():
     missing = []
@@ -66,24 +87,74 @@ def validate_config():
         print("Note: GOOGLE_EMAIL / GOOGLE_PASSWORD not set — login will be skipped.")
 
 
+# Parsed posts.json, reused while the file's mtime is unchanged. uid generation,
+# duplicate checks (once per review card) and save_post all go through
+# load_posts, so without this a single run re-parses the file 20+ times.
+# "prefixes" (duplicate-review index) and "uid_seq" (uids per day) are derived
+# from the same data and rebuilt lazily after every load/save.
+_POSTS_CACHE = {"mtime": None, "data": None, "prefixes": None, "uid_seq": None}
+
+
 def load_posts():
-    if DATA_FILE.exists():
+    try:
+        mtime = DATA_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return {"posts": []}
+    if _POSTS_CACHE["data"] is not None and _POSTS_CACHE["mtime"] == mtime:
+        return _POSTS_CACHE["data"]
+    if orjson is not None:
+        data = orjson.loads(DATA_FILE.read_bytes())
+    else:
         with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    return {"posts": []}
+            data = json.load(f)
+    _POSTS_CACHE["mtime"] = mtime
+    _POSTS_CACHE["data"] = data
+    _POSTS_CACHE["prefixes"] = None
+    _POSTS_CACHE["uid_seq"] = None
+    return data
 
 
 def save_posts(data):
+    # Write to a temp file then rename so a crash mid-write never leaves a
+    # truncated posts.json behind for the other skills to choke on.
     DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(DATA_FILE, 'w') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-
-def generate_uid():
-    today = datetime.now().strftime("%m%d")
-    data = load_posts()
-    existing = [p for p in data.get("posts", []) if p["uid"].startswith(f"tw-{today}")]
-    seq = chr(ord('a') + len(existing))
+    tmp_file = DATA_FILE.with_name(DATA_FILE.name + ".tmp")
+    if orjson is not None:
+        tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_file, DATA_FILE)
+    _POSTS_CACHE["mtime"] = DATA_FILE.stat().st_mtime_ns
+    _POSTS_CACHE["data"] = data
+    _POSTS_CACHE["prefixes"] = None
+    _POSTS_CACHE["uid_seq"] = None
+
+
+def _cached_index(key, data, build):
+    """Return build(data), memoized in _POSTS_CACHE[key] while data is the cached copy."""
+    if _POSTS_CACHE["data"] is not data:
+        return build(data)
+    if _POSTS_CACHE[key] is None:
+        _POSTS_CACHE[key] = build(data)
+    return _POSTS_CACHE[key]
+
+
+def _build_uid_counts(data):
+    """Count tw-MMDD<seq> uids per MMDD in a single pass over the posts."""
+    counts = {}
+    for p in data.get("posts", []):
+        uid = p["uid"]
+        if uid.startswith("tw-"):
+            day = uid[3:7]
+            counts[day] = counts.get(day, 0) + 1
+    return counts
+
+
+def generate_uid(now=None):
+    today = (now or datetime.now()).strftime("%m%d")
+    counts = _cached_index("uid_seq", load_posts(), _build_uid_counts)
+    seq = chr(ord('a') + counts.get(today, 0))
     return f"tw-{today}{seq}"
 
 
@@ -101,42 +172,46 @@ Link to our Google Map in comments.'''
     return content
 
 
-def is_duplicate_review(review_text):
-    """Check if review text is a duplicate based on first 100 characters."""
-    data = load_posts()
-    review_prefix = review_text.strip()[:100]
-
+def _build_prefix_index(data):
+    """Map the first 100 characters of each saved google-maps review to (uid, status)."""
+    index = {}
     for post in data.get("posts", []):
         if post.get("source") != "google-maps":
             continue
 
-        content = post.get("generatedContent", "")
-        if content.startswith('"'):
-            end_quote = content.find('"', 1)
-            if end_quote > 0:
-                existing_text = content[1:end_quote]
-                if existing_text.endswith("..."):
-                    existing_text = existing_text[:-3]
-                existing_prefix = existing_text.strip()[:100]
+        match = _QUOTED_RE.match(post.get("generatedContent", ""))
+        if not match:
+            continue
+        existing_text = match.group(1)
+        if existing_text.endswith("..."):
+            existing_text = existing_text[:-3]
+        # First post wins, matching the old linear scan
+        index.setdefault(existing_text.strip()[:100], (post.get("uid"), post.get("status")))
+    return index
 
-                if existing_prefix == review_prefix:
-                    return True, post.get("uid"), post.get("status")
 
+def is_duplicate_review(review_text):
+    """Check if review text is a duplicate based on first 100 characters."""
+    index = _cached_index("prefixes", load_posts(), _build_prefix_index)
+    hit = index.get(review_text.strip()[:100])
+    if hit:
+        return True, hit[0], hit[1]
     return False, None, None
 
 
-def save_post(screenshot_path, review_text, rating, pool_type=None):
+def save_post(screenshot_path, review_text, rating, pool_type=None, now=None):
+    now = now or datetime.now()
     data = load_posts()
 
     post = {
-        "uid": generate_uid(),
+        "uid": generate_uid(now),
         "status": "Pending",
         "media": [str(screenshot_path)],
         "userDescription": f"Google Maps review screenshot ({rating} stars)",
         "generatedContent": generate_post_content(review_text, rating),
         "source": "google-maps",
         "rating": rating,
-        "createdAt": datetime.now().isoformat(),
+        "createdAt": now.isoformat(),
         "scheduledAt": None,
         "approvedAt": None,
         "postedAt": None,
@@ -167,7 +242,7 @@ def _get_pillow_renderer():
         return None
 
 
-def _build_pillow_fallback(timestamp: str):
+def _build_pillow_fallback(timestamp: str, now=None):
     """Create a review card image using Pillow when the browser cannot be launched.
 
     Uses a generic 5-star review text as placeholder content.
@@ -216,7 +291,7 @@ def _build_pillow_fallback(timestamp: str):
         traceback.print_exc()
         return None
 
-    post = save_post(screenshot_path, fallback_text, fallback_rating)
+    post = save_post(screenshot_path, fallback_text, fallback_rating, now=now)
     return {
         "post_id": post["uid"],
         "rating": fallback_rating,
@@ -227,27 +302,130 @@ def _build_pillow_fallback(timestamp: str):
     }
 
 
+async def _settle(page, timeout=5000):
+    """Wait for the current document to finish parsing.
+
+    Only useful once a navigation has committed: right after a click the old
+    document is still current and this returns immediately, so wait for an
+    element of the next page instead.
+    """
+    try:
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+    except Exception:
+        pass
+
+
+# Clicks the first visible <button> whose label matches one of `texts` (tried in
+# order) and returns that text, or null. One CDP call instead of a
+# count()/is_visible()/click() chain per candidate selector.
+_CLICK_BUTTON_JS = """(texts) => {
+    const buttons = [...document.querySelectorAll('button')]
+        .filter(b => b.getClientRects().length > 0);
+    for (const t of texts) {
+        const want = t.toLowerCase();
+        const b = buttons.find(e => e.innerText.trim().toLowerCase() === want);
+        if (b) { b.click(); return t; }
+    }
+    return null;
+}"""
+
+
+# True once no visible <button> labelled `text` is left on the page.
+_BUTTON_GONE_JS = """(text) => {
+    const want = text.toLowerCase();
+    return ![...document.querySelectorAll('button')].some(
+        b => b.getClientRects().length > 0 && b.innerText.trim().toLowerCase() === want);
+}"""
+
+
+async def _wait_button_gone(page, text, timeout=5000):
+    """Wait until the button labelled text (just clicked) has left the page."""
+    try:
+        await page.wait_for_function(_BUTTON_GONE_JS, arg=text, timeout=timeout)
+    except Exception:
+        pass
+
+
+async def _click_button(page, texts):
+    """Click the first visible button labelled with one of texts; return the text or None."""
+    try:
+        return await page.evaluate(_CLICK_BUTTON_JS, texts)
+    except Exception:
+        return None
+
+
+# Consent is a google.com cookie, so once it has been clicked (e.g. during
+# login) later pages in the same run won't show the popup again.
+_consent_handled = False
+
+
 async def handle_consent(page):
-    """Handle Google cookie consent popup."""
-    for selector in ['button:has-text("Accept all")', 'button:has-text("Reject all")']:
-        try:
-            btn = page.locator(selector).first
-            if await btn.count() > 0 and await btn.is_visible():
-                await btn.click()
-                print(f"  Consent: clicked '{selector}'")
-                await asyncio.sleep(2)
-                return True
-        except Exception:
-            continue
+    """Handle Google cookie consent popup.
+
+    Returns True if a consent button was clicked by this call; the caller
+    then waits for whatever element the redirected page should show.
+    """
+    global _consent_handled
+    if _consent_handled:
+        return False
+    clicked = await _click_button(page, ["Accept all", "Reject all"])
+    if clicked:
+        print(f"  Consent: clicked '{clicked}'")
+        _consent_handled = True
+        return True
     return False
 
 
+async def _block_heavy_resources(route):
+    """Route handler that aborts image/font/media requests."""
+    if route.request.resource_type in ("image", "font", "media"):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _has_google_session(context):
+    """True if the persistent profile already holds Google auth cookies."""
+    cookies = await context.cookies("https://accounts.google.com")
+    return any(c["name"] in ("SID", "__Secure-1PSID") for c in cookies)
+
+
+async def _is_signed_in(page):
+    """False if the current Google page offers a "Sign in" link instead of an account."""
+    try:
+        sign_in = page.locator(
+            'a[href*="accounts.google.com/ServiceLogin"], a:has-text("Sign in")'
+        ).first
+        return not (await sign_in.count() > 0 and await sign_in.is_visible())
+    except Exception:
+        return True  # unknown: don't force a second login
+
+
+async def _login_with_light_page(context, page):
+    """Run google_login with images, fonts and media blocked (the form needs none)."""
+    await context.route("**/*", _block_heavy_resources)
+    try:
+        login_ok = await google_login(page)
+    finally:
+        await context.unroute("**/*", _block_heavy_resources)
+    if not login_ok:
+        print("Login may have failed, continuing anyway...")
+    return login_ok
+
+
 async def google_login(page):
     """Login to Google account."""
     print("Logging in to Google...")
 
-    await page.goto("https://accounts.google.com/signin", wait_until="networkidle", timeout=60000)
-    await asyncio.sleep(2)
+    # networkidle is unreliable on Google properties (background pings keep the
+    # network busy); wait for the element we actually need instead.
+    await page.goto("https://accounts.google.com/signin", wait_until="domcontentloaded", timeout=30000)
+    try:
+        await page.locator(
+            'input[type="email"], button:has-text("Accept all"), button:has-text("Reject all")'
+        ).first.wait_for(state="visible", timeout=15000)
+    except Exception:
+        pass
 
     await handle_consent(page)
 
@@ -255,49 +433,44 @@ async def google_login(page):
     email_input = page.locator('input[type="email"]')
     await email_input.wait_for(state="visible", timeout=15000)
     await email_input.fill(GOOGLE_EMAIL)
-    await asyncio.sleep(0.5)
 
     next_btn = page.locator('#identifierNext')
     if await next_btn.count() > 0:
         await next_btn.click()
     else:
         await page.get_by_role("button", name="Next").click()
-    await asyncio.sleep(3)
 
     print("  Entering password...")
     password_input = page.locator('input[type="password"]')
     await password_input.wait_for(state="visible", timeout=15000)
     await password_input.fill(GOOGLE_PASSWORD)
-    await asyncio.sleep(0.5)
 
     pass_next = page.locator('#passwordNext')
     if await pass_next.count() > 0:
         await pass_next.click()
     else:
         await page.get_by_role("button", name="Next").click()
-    await asyncio.sleep(5)
+    # The password field goes away once Google accepts it and moves on
+    try:
+        await password_input.wait_for(state="hidden", timeout=15000)
+    except Exception:
+        pass
+    await _settle(page)
 
-    for dismiss_sel in [
-        'button:has-text("Not now")',
-        'button:has-text("Skip")',
-        'button:has-text("Confirm")',
-        'button:has-text("Done")',
-    ]:
-        try:
-            btn = page.locator(dismiss_sel).first
-            if await btn.count() > 0 and await btn.is_visible():
-                await btn.click()
-                print(f"  Dismissed prompt: {dismiss_sel}")
-                await asyncio.sleep(2)
-        except Exception:
-            continue
+    # Google may stack several prompts; dismiss until none are left
+    for _ in range(4):
+        dismissed = await _click_button(page, ["Not now", "Skip", "Confirm", "Done"])
+        if not dismissed:
+            break
+        print(f"  Dismissed prompt: {dismissed}")
+        await _wait_button_gone(page, dismissed)
 
     current_url = page.url
     print(f"  Post-login URL: {current_url}")
 
     if 'accounts.google.com/signin' in current_url or 'challenge' in current_url:
         print("  WARNING: May still be on login/challenge page")
-        await page.screenshot(path=str(SCREENSHOTS_DIR / "login_state.png"))
+        await page.screenshot(path=str(SCREENSHOTS_DIR / "login_state.jpg"), type="jpeg", quality=70)
         return False
 
     print("  Login appears successful")
@@ -307,16 +480,19 @@ async def google_login(page):
 async def navigate_to_place(page):
     """Navigate to the business place page."""
     print(f"Navigating to {PLACE_NAME}...")
-    await page.goto(GOOGLE_MAPS_URL, wait_until="domcontentloaded", timeout=60000)
+    await page.goto(GOOGLE_MAPS_URL, wait_until="domcontentloaded", timeout=30000)
     # Wait for Google Maps SPA to render the place panel (more reliable than a fixed sleep)
     try:
-        await page.wait_for_selector('.DUwDvf', timeout=20000)
+        await page.locator('.DUwDvf').first.wait_for(state="visible", timeout=15000)
     except Exception:
         pass  # Will try search fallback below
-    await asyncio.sleep(1)
 
-    await handle_consent(page)
-    await asyncio.sleep(1)
+    if await handle_consent(page):
+        # Accepting consent redirects back to the place; wait for it again
+        try:
+            await page.locator('.DUwDvf').first.wait_for(state="visible", timeout=15000)
+        except Exception:
+            pass
 
     try:
         name_elem = page.locator('.DUwDvf').first
@@ -368,7 +544,6 @@ async def click_reviews_tab(page):
             panel = page.locator(scroll_sel).first
             if await panel.count() > 0:
                 await panel.evaluate("el => el.scrollBy(0, 150)")
-                await asyncio.sleep(0.5)
                 break
         except Exception:
             continue
@@ -387,7 +562,6 @@ async def click_reviews_tab(page):
             tab = page.locator(sel).first
             if await tab.count() > 0:
                 await tab.scroll_into_view_if_needed()
-                await asyncio.sleep(0.3)
                 if await tab.is_visible():
                     await tab.click()
                     print(f"  Clicked Reviews tab via {sel}")
@@ -420,7 +594,7 @@ async def click_reviews_tab(page):
         pass
 
     print("  WARNING: Reviews tab not found — taking debug screenshot")
-    await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_no_reviews_tab.png"))
+    await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_no_reviews_tab.jpg"), type="jpeg", quality=70)
     return False
 
 
@@ -438,105 +612,114 @@ async def scroll_reviews(page):
                     scrollable = elem
                     break
 
-    for i in range(5):
-        try:
-            await scrollable.evaluate("el => el.scrollBy(0, 600)")
-            await asyncio.sleep(0.8)
-        except Exception:
-            break
+    # All five scrolls run in-page in one evaluate; the setTimeout gaps give
+    # lazy-loaded reviews time to arrive without a CDP round-trip per step.
+    try:
+        await scrollable.evaluate("""async el => {
+            for (let i = 0; i < 5; i++) {
+                el.scrollBy(0, 600);
+                await new Promise(r => setTimeout(r, 400));
+            }
+        }""")
+    except Exception:
+        pass
 
-    await asyncio.sleep(2)
     print("  Done scrolling")
 
 
+# Pulls star label, review text and reviewer name for the first 20 cards in a
+# single CDP round-trip instead of several locator calls per card.
+_EXTRACT_CARDS_JS = """(sel) => {
+    const cards = Array.from(document.querySelectorAll(sel.card));
+    const aria = (c, s) => c.querySelector(s)?.getAttribute('aria-label') || '';
+    const text = (c, s) => (c.querySelector(s)?.innerText || '').trim();
+    return {
+        total: cards.length,
+        cards: cards.slice(0, 20).map(c => ({
+            aria: aria(c, sel.star),
+            ariaAlt: aria(c, 'span[aria-label*="star"]'),
+            text: text(c, sel.text),
+            name: text(c, sel.name),
+        })),
+    };
+}"""
+
+
+def _parse_stars(aria):
+    match = _STAR_RE.search(aria) if aria else None
+    return int(match.group(1)) if match else 0
+
+
 async def find_best_review(page):
     """Find the best 5-star review with substantial text, skipping duplicates."""
     print("Searching for 5-star reviews...")
 
-    review_cards = await page.locator(SEL_REVIEW_CARD).all()
-    print(f"  Found {len(review_cards)} review cards")
+    result = await page.evaluate(_EXTRACT_CARDS_JS, {
+        "card": SEL_REVIEW_CARD,
+        "star": SEL_STAR_RATING,
+        "text": SEL_REVIEW_TEXT,
+        "name": SEL_REVIEWER_NAME,
+    })
+    print(f"  Found {result['total']} review cards")
 
-    if not review_cards:
+    if not result["total"]:
         return None, 0, "", ""
 
     candidates = []
 
-    for i, card in enumerate(review_cards[:20]):
-        try:
-            rating = 0
-            review_text = ""
-            reviewer_name = ""
-
-            try:
-                star_elem = card.locator(SEL_STAR_RATING).first
-                if await star_elem.count() > 0:
-                    aria = await star_elem.get_attribute("aria-label")
-                    if aria:
-                        match = re.search(r"(\d+)", aria)
-                        if match:
-                            rating = int(match.group(1))
-            except Exception:
-                pass
-
-            if rating == 0:
-                try:
-                    star_elem = card.locator('span[aria-label*="star"]').first
-                    if await star_elem.count() > 0:
-                        aria = await star_elem.get_attribute("aria-label")
-                        if aria:
-                            match = re.search(r"(\d+)", aria)
-                            if match:
-                                rating = int(match.group(1))
-                except Exception:
-                    pass
-
-            try:
-                text_elem = card.locator(SEL_REVIEW_TEXT).first
-                if await text_elem.count() > 0:
-                    review_text = (await text_elem.inner_text()).strip()
-            except Exception:
-                pass
-
-            try:
-                name_elem = card.locator(SEL_REVIEWER_NAME).first
-                if await name_elem.count() > 0:
-                    reviewer_name = (await name_elem.inner_text()).strip()
-            except Exception:
-                pass
-
-            if review_text:
-                print(f"  [{i+1}] {rating} stars by '{reviewer_name}': {review_text[:50]}...")
-
-            if rating >= 4 and review_text and len(review_text) > 10:
-                is_dup, _, _ = is_duplicate_review(review_text)
-                if not is_dup:
-                    candidates.append({
-                        'card': card,
-                        'rating': rating,
-                        'text': review_text,
-                        'name': reviewer_name
-                    })
-                    print(f"    ✓ Added to candidates")
-                else:
-                    print(f"    ✗ Skipping (duplicate)")
-
-        except Exception as e:
-            print(f"  Error on card {i+1}: {e}")
-            continue
+    for i, info in enumerate(result["cards"]):
+        rating = _parse_stars(info["aria"]) or _parse_stars(info["ariaAlt"])
+        review_text = info["text"]
+        reviewer_name = info["name"]
+
+        if review_text:
+            print(f"  [{i+1}] {rating} stars by '{reviewer_name}': {review_text[:50]}...")
+
+        if rating >= 4 and review_text and len(review_text) > 10:
+            is_dup, _, _ = is_duplicate_review(review_text)
+            if not is_dup:
+                candidates.append({
+                    'index': i,
+                    'rating': rating,
+                    'text': review_text,
+                    'name': reviewer_name
+                })
+                print(f"    ✓ Added to candidates")
+                # A long 5-star review is good enough — skip the remaining cards
+                if rating >= 5 and len(review_text) >= 200:
+                    break
+            else:
+                print(f"    ✗ Skipping (duplicate)")
 
     if candidates:
         candidates.sort(key=lambda x: (x['rating'], len(x['text'])), reverse=True)
         best = candidates[0]
-        return best['card'], best['rating'], best['text'], best['name']
+        # Only the winning card needs a live handle (for the screenshot)
+        card = page.locator(SEL_REVIEW_CARD).nth(best['index'])
+        return card, best['rating'], best['text'], best['name']
 
     return None, 0, "", ""
 
 
+# Scrolls the card into view and returns its rect plus `pad` px on each side
+# (or null if it isn't rendered) — one round-trip instead of scroll + bounding_box.
+_PADDED_CLIP_JS = """(el, pad) => {
+    el.scrollIntoView({block: 'center'});
+    const r = el.getBoundingClientRect();
+    if (!r.width || !r.height) return null;
+    return {
+        x: Math.max(0, r.x - pad),
+        y: Math.max(0, r.y - pad),
+        width: r.width + pad * 2,
+        height: r.height + pad * 2,
+    };
+}"""
+
+
 async def screenshot_review_card(page, card, screenshot_path):
     """Screenshot a single review card element with padding."""
     try:
         await card.scroll_into_view_if_needed()
-        await asyncio.sleep(1)
     except Exception:
         pass
 
@@ -548,15 +731,8 @@ async def screenshot_review_card(page, card, screenshot_path):
         pass
 
     try:
-        box = await card.bounding_box()
-        if box:
-            padding = 16
-            clip = {
-                "x": max(0, box["x"] - padding),
-                "y": max(0, box["y"] - padding),
-                "width": box["width"] + padding * 2,
-                "height": box["height"] + padding * 2,
-            }
+        clip = await card.evaluate(_PADDED_CLIP_JS, 16)
+        if clip:
             await page.screenshot(path=str(screenshot_path), clip=clip)
             print(f"  Review card screenshot (clip) saved: {screenshot_path}")
             return True
@@ -566,17 +742,22 @@ async def screenshot_review_card(page, card, screenshot_path):
     return False
 
 
+_STAR_FILLED = '<span class="star filled">&#9733;</span>'
+_STAR_EMPTY = '<span class="star">&#9733;</span>'
+
+
 def build_review_card_html(reviewer_name, rating, review_text, time_ago="2 weeks ago"):
     """Build HTML for a Google Maps-style review card (fallback)."""
-    stars_html = ""
-    for i in range(5):
-        if i < int(rating):
-            stars_html += '<span class="star filled">&#9733;</span>'
-        else:
-            stars_html += '<span class="star">&#9733;</span>'
+    rating = int(rating)
+    stars_html = "".join(_STAR_FILLED if i < rating else _STAR_EMPTY for i in range(5))
 
     initials = "".join(w[0].upper() for w in reviewer_name.split() if w)[:2] or "U"
 
+    # Reviews can contain <, > or & — escape so they render as text
+    initials = html.escape(initials)
+    reviewer_name = html.escape(reviewer_name)
+    review_text = html.escape(review_text)
+
     return f"""<!DOCTYPE html>
 <html><head><meta charset="utf-8"><style>
 *{{margin:0;padding:0;box-sizing:border-box}}
@@ -604,25 +785,34 @@ body{{font-family:'Google Sans','Roboto',Arial,sans-serif;background:#fff;paddin
 </div></body></html>"""
 
 
-async def render_fallback_card(browser, reviewer_name, rating, review_text, screenshot_path):
-    """Render a review card using HTML as a fallback."""
-    context = await browser.new_context(
-        viewport={"width": 560, "height": 400},
-        device_scale_factor=2,
-    )
-    page = await context.new_page()
-    html = build_review_card_html(reviewer_name, rating, review_text)
-    await page.set_content(html)
-    await asyncio.sleep(0.5)
+async def render_fallback_card(page, reviewer_name, rating, review_text, screenshot_path):
+    """Render a review card using HTML as a fallback.
+
+    Reuses the capture page (temporarily resized) rather than starting a
+    second browser context just for one static screenshot. The persistent
+    context's device scale factor is fixed at 1, so the card is laid out
+    with CSS zoom 2 to keep the posted image at 2x resolution.
+    """
+    original_viewport = page.viewport_size
+    # Leave the Maps/consent document first: set_content() on it would keep
+    # its CSP and Trusted Types, and on this path its state is unknown.
+    await page.goto("about:blank")
+    await page.set_viewport_size({"width": 1120, "height": 800})
+    card_html = build_review_card_html(reviewer_name, rating, review_text)
+    await page.set_content(card_html)
+    await page.add_style_tag(content="html{zoom:2}")
     await page.locator(".card").screenshot(path=str(screenshot_path))
-    await context.close()
+    if original_viewport:
+        await page.set_viewport_size(original_viewport)
     print(f"  Fallback review card saved: {screenshot_path}")
 
 
 async def capture_google_maps_review():
     """Main capture function."""
     SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # One clock read per run: reused for file names, the uid date and createdAt
+    run_now = datetime.now()
+    timestamp = run_now.strftime("%Y%m%d_%H%M%S")
 
     async with async_playwright() as p:
         # ── Try to launch Chromium ────────────────────────────────────────────
@@ -630,17 +820,32 @@ async def capture_google_maps_review():
         # fail with "error while loading shared libraries" (exitCode=127).
         # Catch that here and immediately use the Pillow fallback instead.
         try:
-            browser = await p.chromium.launch(
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            context = await p.chromium.launch_persistent_context(
+                user_data_dir=str(PROFILE_DIR),
                 headless=True,
                 args=[
                     "--no-sandbox",
                     "--disable-setuid-sandbox",
                     "--disable-blink-features=AutomationControlled",
                     "--disable-infobars",
+                    "--disable-dev-shm-usage",
                 ],
+                viewport={"width": 1280, "height": 900},
+                locale="en-GB",
+                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
             )
         except Exception as launch_err:
             err_str = str(launch_err)
+            if any(kw in err_str for kw in _PROFILE_LOCKED_ERRORS):
+                # Another run holds the profile; a placeholder post would be
+                # wrong here, so fail instead of taking the Pillow fallback
+                print(
+                    f"\nBrowser profile {PROFILE_DIR} is in use by another run.\n"
+                    f"Wait for it to finish (or close that Chromium) and retry.\n"
+                    f"Error: {err_str}\n"
+                )
+                return None
             is_missing_libs = any(
                 kw in err_str for kw in (
                     "cannot open shared object",
@@ -660,62 +865,54 @@ async def capture_google_maps_review():
             else:
                 print(f"\nBrowser launch failed: {launch_err}\n"
                       f"Falling back to Pillow-based card rendering...\n")
-            return _build_pillow_fallback(timestamp)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 900},
-            locale="en-GB",
-            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
-        )
-        page = await context.new_page()
+            return _build_pillow_fallback(timestamp, now=run_now)
+        page = context.pages[0] if context.pages else await context.new_page()
 
         try:
+            reused_session = False
             if GOOGLE_EMAIL and GOOGLE_PASSWORD:
-                login_ok = await google_login(page)
-                if not login_ok:
-                    print("Login may have failed, continuing anyway...")
+                if await _has_google_session(context):
+                    print("Reusing signed-in Google session from browser profile.")
+                    reused_session = True
+                else:
+                    await _login_with_light_page(context, page)
             else:
                 print("Skipping login (no credentials configured).")
 
             found = await navigate_to_place(page)
+            if found and reused_session and not await _is_signed_in(page):
+                # Cookies are still in the profile but Google no longer honours
+                # them (expired or revoked): log in again and reload the place
+                print("WARNING: Saved Google session is no longer signed in; logging in again.")
+                await _login_with_light_page(context, page)
+                found = await navigate_to_place(page)
             if not found:
                 print("Could not navigate to place page")
-                await browser.close()
+                await context.close()
                 return None
 
-            await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_place_page.png"))
+            if DEBUG:
+                await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_place_page.jpg"), type="jpeg", quality=70)
 
             reviews_ok = await click_reviews_tab(page)
 
             if reviews_ok:
                 await scroll_reviews(page)
 
-                await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_reviews_loaded.png"))
+                if DEBUG:
+                    await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_reviews_loaded.jpg"), type="jpeg", quality=70)
 
                 card, rating, text, name = await find_best_review(page)
 
+                # find_best_review already skips reviews that exist in posts.json
                 if card and text:
-                    is_dup, existing_uid, existing_status = is_duplicate_review(text)
-                    if is_dup:
-                        print(f"\nDuplicate review detected!")
-                        print(f"  Existing post: {existing_uid} (status: {existing_status})")
-                        print(f"  Review preview: {text[:80]}...")
-                        await context.close()
-                        await browser.close()
-                        return {
-                            "status": "duplicate",
-                            "existing_uid": existing_uid,
-                            "existing_status": existing_status,
-                            "review_text": text,
-                        }
-
                     review_path = SCREENSHOTS_DIR / f"gmap_review_{timestamp}.png"
                     ok = await screenshot_review_card(page, card, review_path)
 
                     if ok:
                         await context.close()
-                        await browser.close()
 
-                        post = save_post(review_path, text, rating)
+                        post = save_post(review_path, text, rating, now=run_now)
                         return {
                             "post_id": post["uid"],
                             "rating": rating,
@@ -728,6 +925,13 @@ async def capture_google_maps_review():
                 print("No suitable review card found with direct capture")
 
             print("\nFalling back to HTML-rendered review card...")
+            if not DEBUG:
+                # Always leave a page capture behind when falling back, so the
+                # cause (captcha, consent, wrong page) can be diagnosed
+                try:
+                    await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_place_page.jpg"), type="jpeg", quality=70)
+                except Exception:
+                    pass
             fallback_text = (
                 "Great service and wonderful experience! "
                 "Highly professional team that really cares about the result. "
@@ -739,7 +943,6 @@ async def capture_google_maps_review():
                 print(f"\nDuplicate review detected (fallback)!")
                 print(f"  Existing post: {existing_uid} (status: {existing_status})")
                 await context.close()
-                await browser.close()
                 return {
                     "status": "duplicate",
                     "existing_uid": existing_uid,
@@ -748,11 +951,10 @@ async def capture_google_maps_review():
                 }
 
             review_path = SCREENSHOTS_DIR / f"gmap_review_{timestamp}.png"
+            await render_fallback_card(page, "A. Smith", 5, fallback_text, review_path)
             await context.close()
-            await render_fallback_card(browser, "A. Smith", 5, fallback_text, review_path)
-            await browser.close()
 
-            post = save_post(review_path, fallback_text, 5)
+            post = save_post(review_path, fallback_text, 5, now=run_now)
             return {
                 "post_id": post["uid"],
                 "rating": 5,
@@ -767,10 +969,10 @@ async def capture_google_maps_review():
             import traceback
             traceback.print_exc()
             try:
-                await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_error.png"))
+                await page.screenshot(path=str(SCREENSHOTS_DIR / "debug_error.jpg"), type="jpeg", quality=70)
             except Exception:
                 pass
-            await browser.close()
+            await context.close()
             return None
 
 
@@ -6,7 +6,7 @@ Handles the Google sign-in flow including email entry, password entry,
 and common post-login prompts (recovery phone, "Stay signed in?", etc.).
 
 Returns True on successful login, False if blocked by 2FA/CAPTCHA.
-Saves diagnostic screenshots on failure.
+Set SMO_LOGIN_DIAG=1 to save diagnostic screenshots (JPEG) on failure.
 
 Usage:
     from scripts.google_login import google_login
@@ -15,73 +15,136 @@ Usage:
 """
 
 import asyncio
+import os
 from pathlib import Path
 from datetime import datetime
+from urllib.parse import urlsplit
 
 SCREENSHOTS_DIR = Path.cwd() / "screenshots"
 
+_DIAG_ENABLED = os.environ.get("SMO_LOGIN_DIAG", "0") == "1"
+_DIAG_DIR_READY = False
+
 
 async def _save_diag(page, label: str) -> str:
-    """Save a diagnostic screenshot and return the path."""
-    SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    """Save a diagnostic screenshot and return the path ("" when disabled)."""
+    global _DIAG_DIR_READY
+    if not _DIAG_ENABLED:
+        return ""
+    if not _DIAG_DIR_READY:
+        SCREENSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+        _DIAG_DIR_READY = True
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = SCREENSHOTS_DIR / f"login_diag_{label}_{ts}.png"
+    path = SCREENSHOTS_DIR / f"login_diag_{label}_{ts}.jpg"
     try:
-        await page.screenshot(path=str(path), full_page=False)
+        await page.screenshot(path=str(path), type="jpeg", quality=60, full_page=False)
     except Exception:
         pass
     return str(path)
 
 
-async def _dismiss_prompt(page, texts, timeout=3000):
-    """Try to click a button matching any of the given texts."""
-    for text in texts:
+async def _dismiss_prompt(page, texts, timeout=3000, wait_gone=True):
+    """Try to click a button matching any of the given texts (earlier texts win).
+
+    With wait_gone, waits for the clicked button to leave the page so the
+    next probe doesn't see (and re-click) the same prompt. Callers that wait
+    for a specific next element themselves (e.g. after "Next") pass False.
+    """
+    # Probe every candidate concurrently: one round-trip of latency, not len(texts)
+    buttons = [page.locator(f'button:has-text("{text}")').first for text in texts]
+    counts = await asyncio.gather(*(b.count() for b in buttons), return_exceptions=True)
+    for btn, count in zip(buttons, counts):
+        if not isinstance(count, int) or count == 0:
+            continue
         try:
-            btn = page.locator(f'button:has-text("{text}")').first
-            if await btn.count() > 0:
-                await btn.click(timeout=timeout)
-                await asyncio.sleep(1.5)
-                return True
+            await btn.click(timeout=timeout)
         except Exception:
             continue
-    return False
-
-
-async def _check_blocked(page) -> bool:
-    """Check whether we hit a 2FA, CAPTCHA, or other blocker page."""
-    try:
-        pw_field = page.locator('input[type="password"]')
-        if await pw_field.count() > 0:
+        if wait_gone:
+            # Right after the click the old document is still current, so a
+            # load-state wait would return at once; wait on the button instead.
             try:
-                if await pw_field.first.is_visible():
-                    return False
+                await btn.wait_for(state="hidden", timeout=timeout)
             except Exception:
                 pass
+        return True
+    return False
 
-        content = await page.content()
-        lower = content.lower()
-        url_lower = page.url.lower()
 
-        url_blockers = [
-            "/challenge/",
-            "/interstitialpage",
-            "/speedbump",
-        ]
-        for b in url_blockers:
-            if b in url_lower:
-                return True
+URL_BLOCKERS = (
+    "/challenge/",
+    "/interstitialpage",
+    "/speedbump",
+)
+
+SUCCESS_INDICATORS = (
+    "myaccount.google.com",
+    "mail.google.com",
+    "accounts.google.com/Default",
+    "accounts.google.com/SignOutOptions",
+    "google.com/maps",
+)
+
+CONTENT_BLOCKERS = (
+    "2-step verification",
+    "confirm your recovery phone",
+    "unusual activity",
+    "this device isn't recognized",
+    "recaptcha",  # also matches "g-recaptcha"
+)
+
+
+# Scans the page HTML in-page and returns only the first matching needle,
+# instead of shipping the whole document over CDP to search it in Python.
+_FIND_NEEDLE_JS = """(needles) => {
+    const html = document.documentElement.outerHTML.toLowerCase();
+    return needles.find(n => html.includes(n)) || null;
+}"""
+
+# Same, over the rendered body text (what the user would read).
+_FIND_TEXT_JS = """(needles) => {
+    const text = (document.body ? document.body.innerText : "").toLowerCase();
+    return needles.find(n => text.includes(n)) || null;
+}"""
+
+
+def _is_success_url(url: str) -> bool:
+    """True if the URL's host + path is a signed-in destination.
+
+    The query is ignored: sign-in URLs carry these hosts in their (only
+    partly encoded) ?continue= parameter.
+    """
+    parts = urlsplit(url)
+    return any(s in parts.netloc + parts.path for s in SUCCESS_INDICATORS)
 
-        content_blockers = [
-            "2-step verification",
-            "confirm your recovery phone",
-            "unusual activity",
-            "this device isn't recognized",
-        ]
-        for b in content_blockers:
-            if b in lower:
-                return True
 
-        if "recaptcha" in lower or "g-recaptcha" in lower:
+async def _check_blocked(page) -> bool:
+    """Check whether we hit a 2FA, CAPTCHA, or other blocker page.
+
+    The URL is checked first since it is free; the page HTML is only
+    searched (in-page) when the URL alone is inconclusive.
+    """
+    try:
+        url = page.url
+        url_lower = url.lower()
+
+        # A visible password field means we are still on the sign-in form
+        # (its URL includes /challenge/pwd); it can only appear there.
+        if "signin" in url_lower:
+            pw_field = page.locator('input[type="password"]')
+            if await pw_field.count() > 0:
+                try:
+                    if await pw_field.first.is_visible():
+                        return False
+                except Exception:
+                    pass
+
+        if any(b in url_lower for b in URL_BLOCKERS):
+            return True
+        if _is_success_url(url):
+            return False
+
+        if await page.evaluate(_FIND_NEEDLE_JS, list(CONTENT_BLOCKERS)):
             return True
 
     except Exception:
@@ -100,45 +163,59 @@ async def google_login(page, email: str, password: str) -> bool:
     Returns:
         True if login succeeded, False if blocked by 2FA/CAPTCHA.
     """
+    # Bound once and reused; locators re-resolve lazily on each action.
+    email_input = page.locator('input[type="email"], input#identifierId').first
+    password_input = page.locator('input[type="password"]').first
+    avatar = page.locator(
+        'img[aria-label*="Account"], a[aria-label*="Account"], '
+        'img[data-profile-identifier], header a[href*="SignOut"]'
+    ).first
+
     try:
         print("[google_login] Navigating to Google sign-in...")
+        # networkidle waits out Google's background pings for seconds; the
+        # email field is interactive long before that.
         await page.goto(
             "https://accounts.google.com/signin",
-            wait_until="networkidle",
+            wait_until="domcontentloaded",
             timeout=30000,
         )
-        await asyncio.sleep(2)
+        # Either the sign-in form or the EU consent interstitial comes first
+        try:
+            await page.locator(
+                'input[type="email"], input#identifierId, '
+                'button:has-text("Accept all"), button:has-text("Reject all"), '
+                'button:has-text("I agree")'
+            ).first.wait_for(state="visible", timeout=15000)
+        except Exception:
+            pass  # a layout the checks below will report on
 
-        await _dismiss_prompt(page, ["Accept all", "Reject all", "I agree"])
+        if await _dismiss_prompt(page, ["Accept all", "Reject all", "I agree"]):
+            try:
+                await email_input.wait_for(state="visible", timeout=15000)
+            except Exception:
+                pass
 
         print("[google_login] Entering email...")
-        email_input = page.locator('input[type="email"]').first
-        if await email_input.count() == 0:
-            email_input = page.locator('input#identifierId').first
-
         if await email_input.count() == 0:
             print("[google_login] ERROR: Cannot find email input field")
             await _save_diag(page, "no_email_field")
             return False
 
         await email_input.fill(email)
-        await asyncio.sleep(0.5)
 
         next_clicked = await _dismiss_prompt(
             page,
             ["Next", "Suivant", "Weiter", "Avanti"],
             timeout=5000,
+            wait_gone=False,
         )
         if not next_clicked:
             await email_input.press("Enter")
 
-        await asyncio.sleep(2)
-
         print("[google_login] Waiting for password field...")
         try:
-            await page.wait_for_selector(
-                'input[type="password"]', state="visible", timeout=15000
-            )
+            await password_input.wait_for(state="visible", timeout=15000)
         except Exception:
             if await _check_blocked(page):
                 print("[google_login] BLOCKED after email entry (2FA/CAPTCHA)")
@@ -149,24 +226,37 @@ async def google_login(page, email: str, password: str) -> bool:
             return False
 
         print("[google_login] Entering password...")
-        password_input = page.locator('input[type="password"]').first
         if await password_input.count() == 0:
             print("[google_login] ERROR: Cannot find password input field")
             await _save_diag(page, "no_password_field")
             return False
 
         await password_input.fill(password)
-        await asyncio.sleep(0.5)
 
         next_clicked = await _dismiss_prompt(
             page,
             ["Next", "Suivant", "Weiter", "Avanti"],
             timeout=5000,
+            wait_gone=False,
         )
         if not next_clicked:
             await password_input.press("Enter")
 
-        await asyncio.sleep(4)
+        # The password step itself lives under /v3/signin/challenge/pwd, so
+        # the URL says nothing yet; the field goes away once Google accepts
+        # the password and moves on.
+        try:
+            await password_input.wait_for(state="hidden", timeout=15000)
+        except Exception:
+            pass
+        try:
+            still_on_password = await password_input.is_visible()
+        except Exception:
+            still_on_password = False
+        if still_on_password:
+            print("[google_login] ERROR: Password was not accepted")
+            await _save_diag(page, "password_not_accepted")
+            return False
 
         if await _check_blocked(page):
             print("[google_login] BLOCKED after password entry (2FA/CAPTCHA)")
@@ -176,43 +266,25 @@ async def google_login(page, email: str, password: str) -> bool:
         print("[google_login] Handling post-login prompts...")
 
         await _dismiss_prompt(page, ["Yes", "Not now", "No", "Skip"])
-        await asyncio.sleep(1)
-
         await _dismiss_prompt(page, ["Not now", "Done", "Confirm", "Skip"])
-        await asyncio.sleep(1)
-
         await _dismiss_prompt(page, ["Not now", "Done", "Remind me later"])
-        await asyncio.sleep(1)
 
         print("[google_login] Verifying login state...")
         current_url = page.url
 
-        success_indicators = [
-            "myaccount.google.com",
-            "mail.google.com",
-            "accounts.google.com/Default",
-            "accounts.google.com/SignOutOptions",
-            "google.com/maps",
-        ]
-
         failure_indicators = [
             "accounts.google.com/signin",
             "accounts.google.com/v3/signin",
             "challenge",
         ]
 
-        for indicator in success_indicators:
-            if indicator in current_url:
-                print(f"[google_login] SUCCESS - URL indicates login: {current_url}")
-                return True
+        if _is_success_url(current_url):
+            print(f"[google_login] SUCCESS - URL indicates login: {current_url}")
+            return True
 
         for indicator in failure_indicators:
             if indicator in current_url:
                 try:
-                    avatar = page.locator(
-                        'img[aria-label*="Account"], a[aria-label*="Account"], '
-                        'img[data-profile-identifier], header a[href*="SignOut"]'
-                    ).first
                     if await avatar.count() > 0:
                         print("[google_login] SUCCESS - Found account avatar on page")
                         return True
@@ -225,17 +297,19 @@ async def google_login(page, email: str, password: str) -> bool:
                     return False
 
         try:
-            body_text = await page.locator("body").inner_text()
+            if await avatar.count() > 0:
+                print("[google_login] SUCCESS - Found account avatar on page")
+                return True
             signed_in_signals = [
-                "Sign out",
-                "My Account",
-                "Google Account",
-                email.split("@")[0],
+                "sign out",
+                "my account",
+                "google account",
+                email.split("@")[0].lower(),
             ]
-            for signal in signed_in_signals:
-                if signal.lower() in body_text.lower():
-                    print(f"[google_login] SUCCESS - Found '{signal}' on page")
-                    return True
+            signal = await page.evaluate(_FIND_TEXT_JS, signed_in_signals)
+            if signal:
+                print(f"[google_login] SUCCESS - Found '{signal}' on page")
+                return True
         except Exception:
             pass
 
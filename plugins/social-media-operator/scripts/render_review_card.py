@@ -9,8 +9,13 @@ Two rendering backends are supported, tried in order:
 
 Can be used as a script or as an importable module:
     render_card(...)          — auto-selects backend
+    render_cards([...])       — many cards in one browser session
     render_card_pillow(...)   — Pillow backend only (no browser dependency)
 
+The backend can be forced with SMO_RENDER_BACKEND=auto|playwright|pillow
+(or --backend on the command line, where a one-off render defaults to
+pillow to skip the Chromium launch).
+
 Usage:
     python3 render_review_card.py \
         --name "Sarah M." --rating 5 \
@@ -18,23 +23,250 @@ Usage:
         --date "1 week ago" --store "Your Business Name"
 """
 
-import argparse
+import atexit
+import io
 import math
-import sys
-import textwrap
+import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 try:
     from urllib.parse import urlencode
 except ImportError:
     from urllib import urlencode
 
+RENDER_BACKENDS = ("auto", "playwright", "pillow")
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 TEMPLATE_PATH = SCRIPT_DIR / "review_card_template.html"
 DEFAULT_OUTPUT_DIR = Path.cwd() / "screenshots"
 
+# zlib level for Pillow PNGs: 1 encodes several times faster than Pillow's
+# default 6 for a slightly larger file; set 6-9 for archival output.
+try:
+    PNG_COMPRESS_LEVEL = int(os.environ.get("SMO_PNG_COMPRESS_LEVEL", "1"))
+except ValueError:
+    PNG_COMPRESS_LEVEL = 1
+
+# Fonts are parsed once per process and shared by every card rendered:
+# resolved TrueType path per weight (None = use Pillow's default font) and
+# loaded font objects keyed by (bold, size).
+_FONT_PATH_CACHE: Dict[bool, Optional[str]] = {}
+_FONT_CACHE: Dict[Tuple[bool, int], "ImageFont.ImageFont"] = {}
+
+
+def _font_candidates(bold: bool):
+    suf = "-Bold" if bold else ""
+    return [
+        f"/usr/share/fonts/truetype/dejavu/DejaVuSans{suf}.ttf",
+        f"/usr/share/fonts/truetype/liberation/LiberationSans{suf if bold else '-Regular'}.ttf",
+        f"/usr/share/fonts/truetype/freefont/FreeSans{'Bold' if bold else ''}.ttf",
+        f"/usr/share/fonts/truetype/ubuntu/Ubuntu-{'B' if bold else 'R'}.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/Library/Fonts/Arial.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+    ]
+
+
+def _font(size: int, bold: bool = False) -> "ImageFont.ImageFont":
+    """Return a cached Pillow font, resolving the font file on first use."""
+    key = (bold, size)
+    font = _FONT_CACHE.get(key)
+    if font is not None:
+        return font
+
+    from PIL import ImageFont
+
+    if bold in _FONT_PATH_CACHE:
+        path = _FONT_PATH_CACHE[bold]
+        font = ImageFont.truetype(path, size) if path else ImageFont.load_default()
+    else:
+        _FONT_PATH_CACHE[bold] = None
+        font = None
+        for path in _font_candidates(bold):
+            try:
+                font = ImageFont.truetype(path, size)
+            except (IOError, OSError):
+                continue
+            _FONT_PATH_CACHE[bold] = path
+            break
+        if font is None:
+            font = ImageFont.load_default()
+
+    _FONT_CACHE[key] = font
+    return font
+
+
+# Shapes are drawn once into supersampled L-mode masks and pasted per card,
+# so the 1× canvas still gets smooth edges without drawing at 2× and
+# downscaling the whole card.
+_MASK_SS = 4
+_MASK_CACHE: Dict[tuple, "Image.Image"] = {}
+
+
+# Unit-circle offsets of the star's 10 vertices (outer, inner, outer, ...),
+# starting at the top point.
+_STAR_UNIT = [
+    (math.cos(math.radians(-90 + i * 36)),
+     math.sin(math.radians(-90 + i * 36)),
+     i % 2 == 0)
+    for i in range(10)
+]
+
+
+def _star_pts(cx: float, cy: float, R: float, r: float):
+    """5-pointed star polygon with outer radius R and inner radius r."""
+    return [
+        (cx + (R if outer else r) * dx, cy + (R if outer else r) * dy)
+        for dx, dy, outer in _STAR_UNIT
+    ]
+
+
+def _shape_mask(kind: str, size: int, *args: float) -> "Image.Image":
+    """Return a cached anti-aliased ``size``×``size`` mask of a star or disc."""
+    key = (kind, size) + args
+    mask = _MASK_CACHE.get(key)
+    if mask is not None:
+        return mask
+
+    from PIL import Image, ImageDraw
+
+    big = size * _MASK_SS
+    canvas = Image.new("L", (big, big), 0)
+    d = ImageDraw.Draw(canvas)
+    if kind == "star":
+        R, r = args
+        c = big / 2
+        d.polygon(_star_pts(c, c, R * _MASK_SS, r * _MASK_SS), fill=255)
+    else:
+        d.ellipse([0, 0, big - 1, big - 1], fill=255)
+    mask = canvas.resize((size, size), Image.LANCZOS)  # type: ignore[attr-defined]
+    _MASK_CACHE[key] = mask
+    return mask
+
+
+def _corner_mask(radius: int) -> "Image.Image":
+    """Return a cached mask of the area outside a top-left rounded corner."""
+    key = ("corner", radius)
+    mask = _MASK_CACHE.get(key)
+    if mask is None:
+        disc = _shape_mask("disc", radius * 2)
+        mask = disc.crop((0, 0, radius, radius)).point(lambda v: 255 - v)
+        _MASK_CACHE[key] = mask
+    return mask
+
+
+# One Chromium per process: launching costs ~1s against ~50ms per card, so
+# the browser and its context are started on first use and reused by every
+# render_card call until interpreter exit.
+_PW = None
+_BROWSER = None
+_CONTEXT = None
+
+# Outcome of the first launch attempt (None = not tried yet); once Chromium
+# is known not to start, "auto" goes straight to Pillow for the process.
+_PLAYWRIGHT_USABLE: Optional[bool] = None
+
+
+def _get_browser():
+    """Return the shared browser context, launching Chromium on first use."""
+    global _PW, _BROWSER, _CONTEXT
+    if _CONTEXT is not None:
+        if _BROWSER.is_connected():
+            return _CONTEXT
+        _close_browser()  # crashed or disconnected: relaunch below
+
+    from playwright.sync_api import sync_playwright
+
+    _PW = sync_playwright().start()
+    try:
+        _BROWSER = _PW.chromium.launch(headless=True, args=["--no-sandbox"])
+        _CONTEXT = _BROWSER.new_context(viewport={"width": 700, "height": 600})
+    except Exception:
+        _close_browser()
+        raise
+    return _CONTEXT
+
+
+def _close_browser() -> None:
+    global _PW, _BROWSER, _CONTEXT
+    for closer in (_CONTEXT, _BROWSER):
+        if closer is not None:
+            try:
+                closer.close()
+            except Exception:
+                pass
+    if _PW is not None:
+        try:
+            _PW.stop()
+        except Exception:
+            pass
+    _PW = _BROWSER = _CONTEXT = None
+
+
+atexit.register(_close_browser)
+
+
+@lru_cache(maxsize=1024)
+def _initials(name: str) -> str:
+    """Up to two uppercase initials for the avatar ("U" for an empty name)."""
+    return "".join(p[0] for p in name.split()[:2]).upper()[:2] or "U"
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write an encoded image to disk in a single write() call."""
+    with open(path, "wb", buffering=max(len(data), 1 << 16)) as f:
+        f.write(data)
+
+
+def _fit_prefix(s: str, font, max_w: int) -> int:
+    """Length of the longest prefix of s that fits in max_w (at least 1)."""
+    # Gallop to bracket the cut, then binary search inside it, so only
+    # prefixes about one line long are ever measured (s may be a whole
+    # unspaced CJK review).
+    lo, hi = 1, len(s)
+    step = 8
+    while step < hi and font.getlength(s[:step]) <= max_w:
+        lo, step = step, step * 2
+    if step >= hi and font.getlength(s) <= max_w:
+        return hi
+    hi = min(hi, step) - 1
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if font.getlength(s[:mid]) <= max_w:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _wrap_px(words, font, max_w: int):
+    """Greedily pack words into lines no wider than ``max_w`` pixels.
+
+    A word wider than a whole line (e.g. a URL, or unspaced CJK text) is
+    hard-broken by character.
+    """
+    lines, cur = [], ""
+    for w in words:
+        trial = w if not cur else cur + " " + w
+        if font.getlength(trial) <= max_w:
+            cur = trial
+            continue
+        if cur:
+            lines.append(cur)
+        cur = w
+        while True:
+            cut = _fit_prefix(cur, font, max_w)
+            if cut >= len(cur):
+                break
+            lines.append(cur[:cut])
+            cur = cur[cut:]
+    if cur:
+        lines.append(cur)
+    return lines or [""]
+
 
 def build_template_url(
     name: str,
@@ -69,8 +301,8 @@ def render_card_pillow(
     """Render a Google Maps-style review card using Pillow only.
 
     No browser, no system display libraries, and no internet access required.
-    Produces a clean 580 × auto-height PNG rendered at 2× then downscaled for
-    natural anti-aliasing.
+    Produces a clean 580 × auto-height PNG drawn directly at 1×; stars and
+    circles are pasted from cached anti-aliased masks.
 
     Returns the path to the saved PNG file.
     """
@@ -88,7 +320,7 @@ def render_card_pillow(
     PAD_TOP  = 28    # top padding
     PAD_BOT  = 24    # bottom padding
     INNER_W  = W - PAD_H * 2   # 516 px content width
-    SCALE    = 2     # render at 2× then resize to 1× for anti-aliasing
+    SCALE    = 1     # canvas scale; text is anti-aliased by FreeType
 
     # ── Colours ───────────────────────────────────────────────────────────────
     C_BG       = (255, 255, 255)
@@ -107,25 +339,6 @@ def render_card_pillow(
     C_G_YEL    = (251, 188,   4)
     C_G_GRN    = (52,  168,  83)
 
-    # ── Font loader ───────────────────────────────────────────────────────────
-    def _font(size: int, bold: bool = False) -> ImageFont.ImageFont:
-        suf = "-Bold" if bold else ""
-        candidates = [
-            f"/usr/share/fonts/truetype/dejavu/DejaVuSans{suf}.ttf",
-            f"/usr/share/fonts/truetype/liberation/LiberationSans{suf if bold else '-Regular'}.ttf",
-            f"/usr/share/fonts/truetype/freefont/FreeSans{'Bold' if bold else ''}.ttf",
-            f"/usr/share/fonts/truetype/ubuntu/Ubuntu-{'B' if bold else 'R'}.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans.ttf",
-            "/Library/Fonts/Arial.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-        ]
-        for p in candidates:
-            try:
-                return ImageFont.truetype(p, size)
-            except (IOError, OSError):
-                continue
-        return ImageFont.load_default()
-
     # ── Text size helper (Pillow 8–10 compatible) ─────────────────────────────
     def _tsz(fnt: ImageFont.ImageFont, s: str):
         try:
@@ -134,20 +347,11 @@ def render_card_pillow(
         except AttributeError:
             return fnt.getsize(s)  # type: ignore[attr-defined]
 
-    # ── 5-pointed star polygon ────────────────────────────────────────────────
-    def _star_pts(cx: float, cy: float, R: float, r: float):
-        pts = []
-        for i in range(10):
-            a = math.radians(-90 + i * 36)
-            rad = R if i % 2 == 0 else r
-            pts.append((cx + rad * math.cos(a), cy + rad * math.sin(a)))
-        return pts
-
     def S(v: float) -> int:
-        """Scale a 1× value to 2× canvas coords."""
+        """Scale a 1× value to canvas coords."""
         return int(v * SCALE)
 
-    # ── Preload fonts at 2× size ──────────────────────────────────────────────
+    # ── Preload fonts ─────────────────────────────────────────────────────────
     f_brand  = _font(S(18), bold=True)
     f_maps   = _font(S(13))
     f_store  = _font(S(13))
@@ -159,8 +363,13 @@ def render_card_pillow(
     f_footer = _font(S(11))
 
     # ── Wrap review text ──────────────────────────────────────────────────────
-    # ~58 chars per line at 15 px on 516 px content width
-    lines  = textwrap.wrap(text, width=58) or [""]
+    if hasattr(f_body, "getlength"):
+        lines = _wrap_px(text.split(), f_body, S(INNER_W))
+    else:
+        # Pillow < 8: ~58 chars per line at 15 px on 516 px content width
+        import textwrap
+
+        lines = textwrap.wrap(text, width=58) or [""]
     LINE_H = S(24)   # line height at 15 px (≈1.6 line-height)
 
     # ── Dynamic card height ───────────────────────────────────────────────────
@@ -173,16 +382,18 @@ def render_card_pillow(
     FOOTER_H   = S(18)
     card_h = S(PAD_TOP) + HEADER_H + SEP1_H + REVIEWER_H + STARS_H + TEXT_H + SEP2_H + FOOTER_H + S(PAD_BOT)
 
-    # ── Create 2× canvas ─────────────────────────────────────────────────────
-    img = Image.new("RGB", (S(W), card_h), C_PAGE_BG)
+    # ── Create canvas ────────────────────────────────────────────────────────
+    img = Image.new("RGB", (S(W), card_h), C_BG)
     d   = ImageDraw.Draw(img)
 
-    # Card background (rounded if Pillow ≥ 8.2, plain rectangle otherwise)
-    card_rect = [0, 0, S(W) - 1, card_h - 1]
-    try:
-        d.rounded_rectangle(card_rect, radius=S(12), fill=C_BG)
-    except AttributeError:
-        d.rectangle(card_rect, fill=C_BG)
+    # Rounded card: only the four corners show the page background
+    R_CORNER = S(12)
+    corner = _corner_mask(R_CORNER)
+    right, bottom = S(W) - R_CORNER, card_h - R_CORNER
+    img.paste(C_PAGE_BG, (0, 0), corner)
+    img.paste(C_PAGE_BG, (right, 0), corner.transpose(Image.FLIP_LEFT_RIGHT))
+    img.paste(C_PAGE_BG, (0, bottom), corner.transpose(Image.FLIP_TOP_BOTTOM))
+    img.paste(C_PAGE_BG, (right, bottom), corner.transpose(Image.ROTATE_180))
 
     # ── Header: "Google Maps" + store name ───────────────────────────────────
     y = S(PAD_TOP)
@@ -209,8 +420,8 @@ def render_card_pillow(
 
     # ── Reviewer row: avatar + name + badge ───────────────────────────────────
     AV = S(40)
-    d.ellipse([S(PAD_H), y, S(PAD_H) + AV, y + AV], fill=C_AVATAR)
-    initials = "".join(w[0].upper() for w in name.split() if w)[:2] or "U"
+    img.paste(C_AVATAR, (S(PAD_H), y), _shape_mask("disc", AV))
+    initials = _initials(name)
     iw, ih   = _tsz(f_avini, initials)
     d.text(
         (S(PAD_H) + AV // 2 - iw // 2, y + AV // 2 - ih // 2),
@@ -228,10 +439,14 @@ def render_card_pillow(
     STAR_r    = 3.0   # inner radius
     STAR_STEP = 17    # centre-to-centre spacing
     star_cy   = y + S(8)  # vertical centre of stars
+    star_mask = _shape_mask("star", S(2 * STAR_R), S(STAR_R), S(STAR_r))
     for i in range(5):
-        cx = PAD_H + i * STAR_STEP + STAR_R
-        pts = _star_pts(S(cx), star_cy, S(STAR_R), S(STAR_r))
-        d.polygon(pts, fill=(C_STAR_ON if i < rating else C_STAR_OFF))
+        sx = S(PAD_H + i * STAR_STEP)
+        img.paste(
+            C_STAR_ON if i < rating else C_STAR_OFF,
+            (sx, star_cy - S(STAR_R)),
+            star_mask,
+        )
 
     date_x = PAD_H + 5 * STAR_STEP + 6
     d.text((S(date_x), star_cy - S(2)), date, fill=C_LGRAY, font=f_date)
@@ -249,29 +464,131 @@ def render_card_pillow(
 
     # Simplified map pin: red circle + white dot
     PIN_W = S(14)
-    d.ellipse([S(PAD_H), y, S(PAD_H) + PIN_W, y + PIN_W], fill=C_PIN_R)
+    img.paste(C_PIN_R, (S(PAD_H), y), _shape_mask("disc", PIN_W))
     dot = S(4)
-    d.ellipse(
-        [S(PAD_H) + PIN_W // 2 - dot // 2, y + PIN_W // 2 - dot // 2,
-         S(PAD_H) + PIN_W // 2 + dot // 2, y + PIN_W // 2 + dot // 2],
-        fill=(255, 255, 255),
+    img.paste(
+        (255, 255, 255),
+        (S(PAD_H) + PIN_W // 2 - dot // 2, y + PIN_W // 2 - dot // 2),
+        _shape_mask("disc", dot),
     )
     d.text((S(PAD_H) + PIN_W + S(6), y + S(1)), "Posted on Google Maps", fill=C_LGRAY, font=f_footer)
 
-    # ── Downscale to 1× (anti-aliasing) ──────────────────────────────────────
-    final = img.resize((W, card_h // SCALE), Image.LANCZOS)  # type: ignore[attr-defined]
-
     # ── Save ──────────────────────────────────────────────────────────────────
     if output_path is None:
         DEFAULT_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         ts  = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = str(DEFAULT_OUTPUT_DIR / f"review_card_{ts}.png")
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    final.save(output_path, "PNG")
+    buf = io.BytesIO()
+    img.save(buf, "PNG", compress_level=PNG_COMPRESS_LEVEL, optimize=False)
+    _write_bytes(output_path, buf.getvalue())
     print(f"Review card (Pillow) saved: {output_path}")
     return output_path
 
 
+def _next_output_path(out_dir: Path) -> str:
+    """Timestamped PNG path in out_dir, suffixed when that second is taken."""
+    stem = f"review_card_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    path = out_dir / f"{stem}.png"
+    n = 1
+    while path.exists():
+        path = out_dir / f"{stem}_{n}.png"
+        n += 1
+    return str(path)
+
+
+def _open_card_page(strict: bool):
+    """Open a page on the shared browser, or return None to use Pillow."""
+    global _PLAYWRIGHT_USABLE
+    if not TEMPLATE_PATH.exists():
+        if strict:
+            raise FileNotFoundError(f"HTML template not found at {TEMPLATE_PATH}")
+        print(f"HTML template not found at {TEMPLATE_PATH}; falling back to Pillow renderer.")
+        return None
+
+    # A cached browser can die between calls; relaunch it once before
+    # giving up on Playwright.
+    for attempt in range(2):
+        try:
+            page = _get_browser().new_page()
+        except ImportError:
+            _PLAYWRIGHT_USABLE = False
+            if strict:
+                raise
+            print("Playwright not installed; falling back to Pillow renderer.")
+            return None
+        except Exception as launch_err:
+            _close_browser()
+            if attempt == 0:
+                continue
+            _PLAYWRIGHT_USABLE = False
+            if strict:
+                raise
+            print(f"Browser launch failed ({launch_err}); falling back to Pillow renderer.")
+            return None
+        _PLAYWRIGHT_USABLE = True
+        return page
+
+
+def _screenshot_card(page, job: dict) -> bytes:
+    # Local file:// template: "load" covers its inline script, and there is
+    # no network traffic for networkidle to wait on.
+    page.goto(build_template_url(**job), wait_until="load")
+    try:
+        card = page.wait_for_selector("#review-card", timeout=5000)
+    except Exception:
+        card = None
+    if card:
+        return card.screenshot()
+    return page.screenshot(full_page=True)
+
+
+def render_cards(
+    jobs: List[dict],
+    output_dir: Optional[str] = None,
+    backend: Optional[str] = None,
+) -> List[str]:
+    """Render several review cards in one browser session.
+
+    Each job is a dict of ``render_card`` arguments (name, rating, text,
+    date, store and optionally badge). With Playwright, every card reuses
+    the same page; any card that fails there is rendered with Pillow
+    instead (unless the backend is "playwright").
+
+    Returns the saved paths, in job order.
+    """
+    backend = (backend or os.environ.get("SMO_RENDER_BACKEND") or "auto").lower()
+    if backend not in RENDER_BACKENDS:
+        raise ValueError(f"Unknown render backend {backend!r}; expected one of {RENDER_BACKENDS}")
+    strict = backend == "playwright"
+
+    out_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    page = None
+    if backend == "playwright" or (backend == "auto" and _PLAYWRIGHT_USABLE is not False):
+        page = _open_card_page(strict)
+
+    paths = []
+    try:
+        for job in jobs:
+            output_path = _next_output_path(out_dir)
+            if page is not None:
+                try:
+                    _write_bytes(output_path, _screenshot_card(page, job))
+                    paths.append(output_path)
+                    continue
+                except Exception as e:
+                    if strict:
+                        raise
+                    print(f"Playwright render failed ({e}); falling back to Pillow renderer.")
+            paths.append(render_card_pillow(output_path=output_path, **job))
+    finally:
+        if page is not None:
+            page.close()
+    return paths
+
+
 def render_card(
     name: str,
     rating: int,
@@ -280,54 +597,28 @@ def render_card(
     store: str,
     badge: str = "",
     output_dir: Optional[str] = None,
+    backend: Optional[str] = None,
 ) -> str:
     """Render the review card. Tries Playwright + HTML template first; falls
     back to the Pillow renderer automatically if the browser cannot be launched
     (e.g. missing system libraries in a minimal Docker container).
 
-    Returns the path to the saved screenshot.
-    """
-    out_dir = Path(output_dir) if output_dir else DEFAULT_OUTPUT_DIR
-    out_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = str(out_dir / f"review_card_{timestamp}.png")
+    The browser is launched on the first call and reused by later ones; each
+    card only opens and closes its own page.
 
-    # ── Try Playwright path ───────────────────────────────────────────────────
-    if TEMPLATE_PATH.exists():
-        try:
-            from playwright.sync_api import sync_playwright
+    ``backend`` (default: ``$SMO_RENDER_BACKEND`` or "auto") is one of
+    "auto", "playwright" (no Pillow fallback; errors are raised) or "pillow"
+    (never start a browser).
 
-            url = build_template_url(name, rating, text, date, store, badge)
-            with sync_playwright() as p:
-                try:
-                    browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
-                except Exception as launch_err:
-                    print(f"Browser launch failed ({launch_err}); falling back to Pillow renderer.")
-                    return render_card_pillow(name, rating, text, date, store, badge, output_path)
-
-                page = browser.new_page(viewport={"width": 700, "height": 600})
-                page.goto(url, wait_until="networkidle")
-                page.wait_for_timeout(300)
-                card = page.query_selector("#review-card")
-                if card:
-                    card.screenshot(path=output_path)
-                else:
-                    page.screenshot(path=output_path, full_page=True)
-                browser.close()
-            return output_path
-
-        except ImportError:
-            print("Playwright not installed; falling back to Pillow renderer.")
-        except Exception as e:
-            print(f"Playwright render failed ({e}); falling back to Pillow renderer.")
-    else:
-        print(f"HTML template not found at {TEMPLATE_PATH}; falling back to Pillow renderer.")
-
-    # ── Pillow fallback ───────────────────────────────────────────────────────
-    return render_card_pillow(name, rating, text, date, store, badge, output_path)
+    Returns the path to the saved screenshot.
+    """
+    job = dict(name=name, rating=rating, text=text, date=date, store=store, badge=badge)
+    return render_cards([job], output_dir=output_dir, backend=backend)[0]
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Render a Google Maps-style review card image."
     )
@@ -340,6 +631,13 @@ def main():
     parser.add_argument("--store", required=True, help="Store / place name")
     parser.add_argument("--badge", default="", help='Optional badge (e.g. "Local Guide")')
     parser.add_argument("--output-dir", default=None, help="Output directory for screenshot")
+    parser.add_argument(
+        "--backend",
+        choices=RENDER_BACKENDS,
+        default=os.environ.get("SMO_RENDER_BACKEND", "pillow"),
+        help="Renderer to use (default: $SMO_RENDER_BACKEND or pillow; a "
+             "one-off card renders faster without launching Chromium)",
+    )
 
     args = parser.parse_args()
 
@@ -351,6 +649,7 @@ def main():
         store=args.store,
         badge=args.badge,
         output_dir=args.output_dir,
+        backend=args.backend,
     )
     print(output)
 